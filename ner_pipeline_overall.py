@@ -4,21 +4,67 @@ Enhanced Multilingual NER Pipeline for LLM Integration
 Displays full text content and extracts all entity types for comprehensive LLM analysis
 """
 import argparse
-from typing import List, Dict
+import logging
+import os
+import sys
+from typing import List, Dict, Tuple
 import re
 from collections import defaultdict
 import unicodedata
 import spacy
 
+# Optional: the third-party 'regex' engine compiles Unicode categories
+# (\p{Lu}, \p{Ll}) to compact bitsets instead of the explicit accented
+# character classes the stdlib engine has to walk
+try:
+    import regex as _regex
+    REGEX_MODULE_AVAILABLE = True
+except ImportError:
+    REGEX_MODULE_AVAILABLE = False
+
 # Import our existing multilingual translator
 from multi_language_translator import UnifiedTranslator
 
+log = logging.getLogger("ner_pipeline")
+
+def _enable_debug_logging():
+    """Route log.debug to stderr for callers passing debug=True"""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+    log.setLevel(logging.DEBUG)
+
+# ASCII-fold table covering every accented character the person-name
+# patterns can emit; str.translate runs in C over the whole string
+_ASCII_FOLD = str.maketrans({
+    'á': 'a', 'à': 'a', 'â': 'a', 'ä': 'a',
+    'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e',
+    'í': 'i', 'ì': 'i', 'î': 'i', 'ï': 'i',
+    'ó': 'o', 'ò': 'o', 'ô': 'o', 'ö': 'o',
+    'ú': 'u', 'ù': 'u', 'û': 'u', 'ü': 'u',
+    'ñ': 'n', 'ç': 'c', 'ß': 'ss',
+    'Á': 'A', 'À': 'A', 'Â': 'A', 'Ä': 'A',
+    'É': 'E', 'È': 'E', 'Ê': 'E', 'Ë': 'E',
+    'Í': 'I', 'Ì': 'I', 'Î': 'I', 'Ï': 'I',
+    'Ó': 'O', 'Ò': 'O', 'Ô': 'O', 'Ö': 'O',
+    'Ú': 'U', 'Ù': 'U', 'Û': 'U', 'Ü': 'U',
+    'Ñ': 'N', 'Ç': 'C',
+})
+
+# Combining-mark stripper for names the fold table misses; the 'regex'
+# engine removes them in one C-level scan instead of a per-char loop
+_MN_RE = _regex.compile(r'\p{Mn}+') if REGEX_MODULE_AVAILABLE else None
+
 class Entity:
     """Enhanced entity class for all entity types (PERSON, ORG, GPE, etc.)"""
-    def __init__(self, name: str, entity_type: str, start_char: int, end_char: int, 
+    __slots__ = ('name', 'entity_type', 'start_char', 'end_char',
+                 'context', 'confidence', 'source', 'language', 'normalized_name')
+
+    def __init__(self, name: str, entity_type: str, start_char: int, end_char: int,
                  context: str = "", confidence: float = 1.0, source: str = "spacy", language: str = "en"):
         self.name = name
-        self.entity_type = entity_type  # PERSON, ORG, GPE, MONEY, etc.
+        # Interned: the handful of distinct labels recur across hundreds of
+        # entities and form half of every dedup key
+        self.entity_type = sys.intern(entity_type)  # PERSON, ORG, GPE, MONEY, etc.
         self.start_char = start_char
         self.end_char = end_char
         self.context = context
@@ -29,9 +75,18 @@ class Entity:
     
     def _normalize_name(self, name: str) -> str:
         """Normalize name for comparison (remove accents, lowercase)"""
-        normalized = unicodedata.normalize('NFD', name)
-        normalized = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
-        return normalized.lower().strip()
+        folded = name.translate(_ASCII_FOLD)
+        if folded.isascii():
+            # Interning lets repeated mentions share one object, so dedup
+            # key hashing/equality short-circuits on identity
+            return sys.intern(folded.lower().strip())
+        # Characters outside the fold table: full NFD combining-mark strip
+        normalized = unicodedata.normalize('NFD', folded)
+        if _MN_RE is not None:
+            return sys.intern(_MN_RE.sub('', normalized).lower().strip())
+        category = unicodedata.category
+        normalized = ''.join(c for c in normalized if category(c) != 'Mn')
+        return sys.intern(normalized.lower().strip())
     
     def __repr__(self):
         return f"Entity(name='{self.name}', type={self.entity_type}, confidence={self.confidence:.2f}, source='{self.source}')"
@@ -57,12 +112,38 @@ class EnhancedMultilingualNER:
         
         # Initialize language-specific patterns for person names
         self._init_person_patterns()
+
+        # Per-call lookups hoisted out of the extraction loops
+        self._source_by_lang = {
+            lang: (f"{lang}_spacy" if lang != 'en' else 'spacy') for lang in self.models
+        }
+        self._fp = {
+            lang: frozenset(self.false_positives.get(lang, ())) for lang in self.models
+        }
     
+    # Components we never read from: only doc.ents is consumed downstream,
+    # and tagger/parser dominate the per-token cost of the default pipeline
+    UNUSED_PIPE_COMPONENTS = ["parser", "tagger", "lemmatizer", "attribute_ruler"]
+
+    # Honorific prefixes per language, shared by the in-pipeline EntityRuler
+    # token patterns and the regex fallback patterns
+    PERSON_TITLES = {
+        'es': ('Don', 'Doña', 'Sr.', 'Sra.', 'Dr.', 'Dra.'),
+        'fr': ('M.', 'Mme', 'Mlle', 'Dr.', 'Pr.'),
+        'de': ('Herr', 'Frau', 'Dr.', 'Prof.'),
+        'en': ('Mr.', 'Mrs.', 'Ms.', 'Dr.', 'Prof.'),
+    }
+
     def _load_models(self):
-        """Load all available spaCy models"""
+        """Load all available spaCy models (NER-only, unused components disabled)"""
         for lang, config in self.models.items():
             try:
-                config['nlp'] = spacy.load(config['model'])
+                try:
+                    config['nlp'] = spacy.load(config['model'], disable=self.UNUSED_PIPE_COMPONENTS)
+                except ValueError:
+                    # Older model packages may not accept the disable list
+                    config['nlp'] = spacy.load(config['model'])
+                self._attach_person_ruler(lang, config['nlp'])
                 if lang not in self.available_languages:
                     self.available_languages.append(lang)
                 print(f"✅ {lang.upper()} model '{config['model']}' loaded successfully!")
@@ -76,222 +157,347 @@ class EnhancedMultilingualNER:
                     print(f"Install it with: python -m spacy download {config['model']}")
                     print(f"Continuing without {lang.upper()} support...")
     
-    def _init_person_patterns(self):
-        """Initialize regex patterns for person names in each language"""
-        self.person_patterns = {
-            'es': [
-                r'\b[A-ZÁÉÍÓÚÑ][a-záéíóúñ]+(?:\s+(?:de|del|de\s+la|de\s+los|y|e)\s+)?(?:[A-ZÁÉÍÓÚÑ][a-záéíóúñ]+\s*){1,3}\b',
-                r'\b(?:Don|Doña|Sr\.|Sra\.|Dr\.|Dra\.)\s+([A-ZÁÉÍÓÚÑ][a-záéíóúñ]+(?:\s+[A-ZÁÉÍÓÚÑ][a-záéíóúñ]+)*)\b',
-            ],
-            'fr': [
-                r'\b[A-ZÁÀÂÄÉÈÊËÍÌÎÏÓÒÔÖÚÙÛÜÇ][a-záàâäéèêëíìîïóòôöúùûüç]+(?:\s+(?:de|du|des|d\'|le|la|les)\s+)?(?:[A-ZÁÀÂÄÉÈÊËÍÌÎÏÓÒÔÖÚÙÛÜÇ][a-záàâäéèêëíìîïóòôöúùûüç]+\s*){1,3}\b',
-                r'\b(?:M\.|Mme|Mlle|Dr\.|Pr\.)\s+([A-ZÁÀÂÄÉÈÊËÍÌÎÏÓÒÔÖÚÙÛÜÇ][a-záàâäéèêëíìîïóòôöúùûüç]+(?:\s+[A-ZÁÀÂÄÉÈÊËÍÌÎÏÓÒÔÖÚÙÛÜÇ][a-záàâäéèêëíìîïóòôöúùûüç]+)*)\b',
-            ],
-            'de': [
-                r'\b[A-ZÄÖÜ][a-zäöüß]+(?:\s+(?:von|zu|der|des|den)\s+)?(?:[A-ZÄÖÜ][a-zäöüß]+\s*){1,3}\b',
-                r'\b(?:Herr|Frau|Dr\.|Prof\.)\s+([A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß]+)*)\b',
+    def _attach_person_ruler(self, lang: str, nlp):
+        """Attach honorific person patterns as an EntityRuler inside the pipeline.
+
+        High-precision "title + capitalized words" matches are found during
+        the single nlp() pass by spaCy's Cython Matcher, sharing tokenization
+        with the statistical NER instead of needing a second regex scan.
+        """
+        try:
+            ruler = nlp.add_pipe("entity_ruler", before="ner")
+        except ValueError:
+            # No ner component in this package — keep the regex-only path
+            return
+        ruler.add_patterns([{
+            "label": "PERSON",
+            "id": f"{lang}_ruler",
+            "pattern": [
+                {"TEXT": {"IN": list(self.PERSON_TITLES[lang])}},
+                {"IS_TITLE": True, "OP": "+"},
             ],
-            'en': [
-                r'\b[A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?\b',
-                r'\b(?:Mr\.|Mrs\.|Ms\.|Dr\.|Prof\.)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b',
-            ]
+        }])
+
+    def _init_person_patterns(self):
+        """Initialize and precompile regex patterns for person names in each language"""
+        # Title prefixes and surname connectors per language; the capital /
+        # lowercase letter classes depend on which regex engine is available
+        titles = {
+            lang: '|'.join(map(re.escape, prefixes))
+            for lang, prefixes in self.PERSON_TITLES.items()
         }
-        
-        # Common false positives to filter
+        connectors = {
+            'es': r'de|del|de\s+la|de\s+los|y|e',
+            'fr': r'de|du|des|d\'|le|la|les',
+            'de': r'von|zu|der|des|den',
+            'en': None,
+        }
+        if REGEX_MODULE_AVAILABLE:
+            engine = _regex
+            letter_classes = {lang: (r'\p{Lu}', r'\p{Ll}') for lang in titles}
+        else:
+            engine = re
+            letter_classes = {
+                'es': ('[A-ZÁÉÍÓÚÑ]', '[a-záéíóúñ]'),
+                'fr': ('[A-ZÁÀÂÄÉÈÊËÍÌÎÏÓÒÔÖÚÙÛÜÇ]', '[a-záàâäéèêëíìîïóòôöúùûüç]'),
+                'de': ('[A-ZÄÖÜ]', '[a-zäöüß]'),
+                'en': ('[A-Z]', '[a-z]'),
+            }
+
+        # Common false positives to filter (also consulted by the spaCy path)
         self.false_positives = {
             'es': {'según', 'aunque', 'también', 'después', 'durante', 'mientras', 'entonces', 'además'},
             'fr': {'selon', 'depuis', 'pendant', 'maintenant', 'toujours', 'encore', 'ainsi', 'donc'},
             'de': {'jedoch', 'außerdem', 'während', 'bereits', 'dennoch', 'schließlich', 'allerdings'},
             'en': {'however', 'therefore', 'although', 'meanwhile', 'furthermore', 'nevertheless'}
         }
+
+        # Compile one alternation per language so each text buffer is
+        # scanned once; patterns are expensive to parse and re's internal
+        # cache is too small to rely on under load. The titled branch comes
+        # first so honorifics win over the plain form and capture the bare
+        # name (title stripped) in the 'titled' group. A case-insensitive
+        # negative lookahead rejects known false positives during the scan
+        # itself instead of emitting candidates for Python to filter.
+        self.person_patterns = {}
+        for lang, title_alt in titles.items():
+            upper, lower = letter_classes[lang]
+            word = '%s%s+' % (upper, lower)
+            titled = r'(?:%s)\s+(?P<titled>%s(?:\s+%s)*)' % (title_alt, word, word)
+            if connectors[lang]:
+                plain = r'%s(?:\s+(?:%s)\s+)?(?:%s\s*){1,3}' % (word, connectors[lang], word)
+            else:
+                plain = r'%s\s+%s(?:\s+%s)?' % (word, word, word)
+            fp_alt = '|'.join(map(re.escape, sorted(self.false_positives[lang], key=len, reverse=True)))
+            self.person_patterns[lang] = engine.compile(
+                r'\b(?!(?i:%s)\b)(?:%s|(?P<plain>%s))\b' % (fp_alt, titled, plain),
+                engine.UNICODE,
+            )
+
+        # Shared auxiliary pattern used by the hot extraction/confidence paths
+        self._digit_re = re.compile(r'\d')
+
+        # Context words suggesting a person, per language; checked as whole
+        # tokens via set intersection instead of substring scans (which also
+        # stops 'mr' from matching inside unrelated words)
+        self._person_indicator_sets = {
+            'es': frozenset(['señor', 'señora', 'presidente', 'director', 'fiscal', 'juez']),
+            'fr': frozenset(['monsieur', 'madame', 'président', 'directeur', 'procureur', 'juge']),
+            'de': frozenset(['herr', 'frau', 'präsident', 'direktor', 'staatsanwalt', 'richter']),
+            'en': frozenset(['mr', 'mrs', 'president', 'director', 'prosecutor', 'judge']),
+        }
+        self._token_re = re.compile(r'\w+')
+
+        # Accented characters per language, as frozensets so the confidence
+        # scorer can use a single C-level isdisjoint check per entity
+        self._accent_sets = {
+            'es': frozenset('áéíóúñ'),
+            'fr': frozenset('àâäéèêëíìîïóòôöúùûüç'),
+            'de': frozenset('äöüß'),
+        }
     
     def extract_all_entities_spacy(self, text: str, language: str) -> List[Entity]:
-        """Extract ALL entity types using spaCy model"""
-        if language not in self.available_languages:
-            print(f"⚠️ Language '{language}' not available, skipping spaCy extraction")
+        """Extract ALL entity types using spaCy model (single-document wrapper)"""
+        return self.extract_batch([(text, language)])[0]
+
+    def extract_batch(self, docs: List[Tuple[str, str]], n_process: int = 1) -> List[List[Entity]]:
+        """Extract ALL entity types for many (text, language) pairs at once.
+
+        Texts are grouped by language and pushed through each model's
+        nlp.pipe(), which amortizes per-call overhead across documents.
+        Results come back in the same order as the input pairs. Pass
+        n_process > 1 to spread a large batch across worker processes.
+        """
+        results: List[List[Entity]] = [[] for _ in docs]
+
+        # Group document indices by language so each model pipes once
+        groups = defaultdict(list)
+        for idx, (_, language) in enumerate(docs):
+            if language not in self.available_languages:
+                print(f"⚠️ Language '{language}' not available, skipping spaCy extraction")
+                continue
+            groups[language].append(idx)
+
+        for language, indices in groups.items():
+            nlp = self.models[language]['nlp']
+            source = self._source_by_lang[language]
+            false_positives = self._fp[language]
+            texts = [docs[i][0] for i in indices]
+
+            for idx, doc in zip(indices, nlp.pipe(texts, batch_size=64, n_process=n_process)):
+                text = docs[idx][0]
+                len_text = len(text)
+                entities = []
+
+                for ent in doc.ents:
+                    # Cross the Span property boundary once per field
+                    ent_text = ent.text
+                    start, end, label = ent.start_char, ent.end_char, ent.label_
+
+                    # Skip obvious false positives
+                    if ent_text.lower() in false_positives:
+                        continue
+
+                    # EntityRuler matches carry the honorific in the span;
+                    # drop it so names dedupe against the other sources
+                    if ent.ent_id_:
+                        name = ent_text.split(None, 1)[-1]
+                        ent_source = 'ruler'
+                    else:
+                        name = ent_text
+                        ent_source = source
+
+                    # Get surrounding context
+                    context = text[max(0, start - 75):min(len_text, end + 75)].strip()
+
+                    # Calculate confidence based on entity type and context
+                    confidence = self._calculate_confidence(name, label, context, language)
+
+                    entity = Entity(
+                        name=name.strip(),
+                        entity_type=label,
+                        start_char=start,
+                        end_char=end,
+                        context=context,
+                        confidence=confidence,
+                        source=ent_source,
+                        language=language
+                    )
+                    entities.append(entity)
+
+                results[idx] = entities
+
+        return results
+    
+    def extract_person_entities_regex(self, text: str, language: str) -> List[Entity]:
+        """Extract person entities using language-specific regex patterns"""
+        if language not in self.person_patterns:
             return []
         
-        nlp = self.models[language]['nlp']
-        source = f"{language}_spacy" if language != 'en' else 'spacy'
-        
-        doc = nlp(text)
         entities = []
-        
-        for ent in doc.ents:
-            # Skip obvious false positives
-            if ent.text.lower() in self.false_positives.get(language, set()):
+        pattern = self.person_patterns[language]
+        search = pattern.search
+
+        # Greedy left-to-right scan: each match consumes its span, so no
+        # overlapping candidates ever reach Entity construction or dedup
+        pos = 0
+        while (match := search(text, pos)) is not None:
+            pos = match.end()
+            name = (match.group('titled') or match.group('plain')).strip()
+
+            # Skip if too short or containing numbers (false positives are
+            # already rejected by the pattern's negative lookahead)
+            if len(name.split()) < 1 or self._digit_re.search(name):
                 continue
-            
-            # Get surrounding context
-            context_start = max(0, ent.start_char - 75)
-            context_end = min(len(text), ent.end_char + 75)
+
+            # Get context
+            context_start = max(0, match.start() - 75)
+            context_end = min(len(text), match.end() + 75)
             context = text[context_start:context_end].strip()
-            
-            # Calculate confidence based on entity type and context
-            confidence = self._calculate_confidence(ent.text, ent.label_, context, language)
-            
+
+            confidence = self._calculate_confidence(name, 'PERSON', context, language, is_regex=True)
+
             entity = Entity(
-                name=ent.text.strip(),
-                entity_type=ent.label_,
-                start_char=ent.start_char,
-                end_char=ent.end_char,
+                name=name,
+                entity_type='PERSON',
+                start_char=match.start(),
+                end_char=match.end(),
                 context=context,
                 confidence=confidence,
-                source=source,
+                source="regex",
                 language=language
             )
             entities.append(entity)
-        
-        return entities
-    
-    def extract_person_entities_regex(self, text: str, language: str) -> List[Entity]:
-        """Extract person entities using language-specific regex patterns"""
-        if language not in self.person_patterns:
-            return []
-        
-        entities = []
-        patterns = self.person_patterns[language]
-        
-        for pattern in patterns:
-            for match in re.finditer(pattern, text):
-                name = match.group(1) if match.groups() else match.group(0)
-                name = name.strip()
-                
-                # Skip if too short, contains numbers, or is false positive
-                if (len(name.split()) < 1 or 
-                    re.search(r'\d', name) or 
-                    name.lower() in self.false_positives.get(language, set())):
-                    continue
-                
-                # Get context
-                context_start = max(0, match.start() - 75)
-                context_end = min(len(text), match.end() + 75)
-                context = text[context_start:context_end].strip()
-                
-                confidence = self._calculate_confidence(name, 'PERSON', context, language, is_regex=True)
-                
-                entity = Entity(
-                    name=name,
-                    entity_type='PERSON',
-                    start_char=match.start(),
-                    end_char=match.end(),
-                    context=context,
-                    confidence=confidence,
-                    source="regex",
-                    language=language
-                )
-                entities.append(entity)
-        
+
         return entities
     
     def _calculate_confidence(self, text: str, entity_type: str, context: str, 
                             language: str, is_regex: bool = False) -> float:
         """Calculate confidence score for entities"""
         confidence = 0.7 if is_regex else 0.85  # Base confidence
-        
+        text_lower = text.lower()
+
         # Boost for longer names/entities
         if len(text.split()) >= 2:
             confidence += 0.1
-        
+
         # Boost for proper capitalization
         if all(word[0].isupper() for word in text.split() if word):
             confidence += 0.05
-        
+
         # Language-specific character boosts
-        if language == 'es' and any(char in text.lower() for char in 'áéíóúñ'):
-            confidence += 0.1
-        elif language == 'fr' and any(char in text.lower() for char in 'àâäéèêëíìîïóòôöúùûüç'):
-            confidence += 0.1
-        elif language == 'de' and any(char in text.lower() for char in 'äöüß'):
+        accent_set = self._accent_sets.get(language)
+        if accent_set is not None and not accent_set.isdisjoint(text_lower):
             confidence += 0.1
         
         # Entity type specific adjustments
         if entity_type in ['PERSON', 'PER']:
-            # Context indicators for persons
-            person_indicators = {
-                'es': ['señor', 'señora', 'presidente', 'director', 'fiscal', 'juez'],
-                'fr': ['monsieur', 'madame', 'président', 'directeur', 'procureur', 'juge'],
-                'de': ['herr', 'frau', 'präsident', 'direktor', 'staatsanwalt', 'richter'],
-                'en': ['mr', 'mrs', 'president', 'director', 'prosecutor', 'judge']
-            }
-            if any(indicator in context.lower() for indicator in person_indicators.get(language, [])):
+            # Whole-token context indicators for persons
+            context_tokens = set(self._token_re.findall(context.lower()))
+            if context_tokens & self._person_indicator_sets.get(language, frozenset()):
                 confidence += 0.15
         
         # Penalize suspicious patterns
-        if re.search(r'\d', text):
+        if self._digit_re.search(text):
             confidence -= 0.2
         
         return max(0.1, min(1.0, confidence))
     
-    def clean_and_deduplicate_entities(self, entities: List[Entity]) -> List[Entity]:
-        """Clean and deduplicate entities"""
-        # Group by normalized names and entity type
-        entity_groups = defaultdict(list)
+    @staticmethod
+    def _accumulate(entities: List[Entity], acc: Dict[tuple, Entity]):
+        """Fold entities into a shared dedup accumulator, in place.
+
+        Keeps the incumbent best per (normalized_name, entity_type):
+        highest confidence, then longest name.
+        """
         for entity in entities:
             key = (entity.normalized_name, entity.entity_type)
-            entity_groups[key].append(entity)
-        
-        final_entities = []
-        for _, group in entity_groups.items():
-            if not group:
-                continue
-            
-            # Select best entity from group (highest confidence, then longest name)
-            best_entity = max(group, key=lambda e: (e.confidence, len(e.name)))
-            final_entities.append(best_entity)
-        
-        return sorted(final_entities, key=lambda x: (x.entity_type, x.confidence), reverse=True)
+            incumbent = acc.get(key)
+            if incumbent is None or \
+                    (entity.confidence, len(entity.name)) > (incumbent.confidence, len(incumbent.name)):
+                acc[key] = entity
+
+    def clean_and_deduplicate_entities(self, entities: List[Entity]) -> List[Entity]:
+        """Clean and deduplicate entities"""
+        best: Dict[tuple, Entity] = {}
+        self._accumulate(entities, best)
+        return sorted(best.values(), key=lambda x: (x.entity_type, x.confidence), reverse=True)
     
     def process_multilingual_extraction(self, original_text: str, translated_text: str, 
                                       original_lang: str, debug: bool = True) -> Dict:
         """Process entity extraction on both original and translated text"""
         if debug:
-            print(f"\n{'='*80}")
-            print("🌍 ENHANCED MULTILINGUAL ENTITY EXTRACTION")
-            print(f"{'='*80}")
-            print(f"Original language: {original_lang}")
-            print(f"Available models: {', '.join(self.available_languages)}")
-        
-        all_entities = []
-        
+            _enable_debug_logging()
+
+        debug = log.isEnabledFor(logging.DEBUG)
+        if debug:
+            log.debug("\n%s", '=' * 80)
+            log.debug("🌍 ENHANCED MULTILINGUAL ENTITY EXTRACTION")
+            log.debug("%s", '=' * 80)
+            log.debug("Original language: %s", original_lang)
+            log.debug("Available models: %s", ', '.join(self.available_languages))
+        
+        # One dedup accumulator shared by all four extractions: losers are
+        # dropped as they arrive instead of piling up in an interim list
+        acc: Dict[tuple, Entity] = {}
+        raw_count = 0
+
+        # English sources come back from the translator unchanged, so the
+        # second pass would re-parse the identical buffer — skip it entirely
+        skip_translated = original_lang == 'en' or original_text == translated_text
+
+        if skip_translated:
+            original_spacy_entities = self.extract_batch([(original_text, original_lang)])[0]
+            english_spacy_entities = []
+        else:
+            # Run both spaCy passes through one batched pipe() call
+            original_spacy_entities, english_spacy_entities = self.extract_batch([
+                (original_text, original_lang),
+                (translated_text, 'en')
+            ])
+
         # Step 1: Extract from original text
         if debug:
-            print(f"\n1️⃣ Extracting from original {original_lang} text...")
-        
+            log.debug("\n1️⃣ Extracting from original %s text...", original_lang)
+
         if original_lang in self.available_languages:
-            original_spacy_entities = self.extract_all_entities_spacy(original_text, original_lang)
             original_person_regex = self.extract_person_entities_regex(original_text, original_lang)
-            
+
             if debug:
-                print(f"   {original_lang.upper()} spaCy entities: {len(original_spacy_entities)}")
-                print(f"   {original_lang.upper()} person regex: {len(original_person_regex)}")
-            
-            all_entities.extend(original_spacy_entities)
-            all_entities.extend(original_person_regex)
+                log.debug("   %s spaCy entities: %d", original_lang.upper(), len(original_spacy_entities))
+                log.debug("   %s person regex: %d", original_lang.upper(), len(original_person_regex))
+
+            raw_count += len(original_spacy_entities) + len(original_person_regex)
+            self._accumulate(original_spacy_entities, acc)
+            self._accumulate(original_person_regex, acc)
         else:
             if debug:
-                print(f"   ⚠️ {original_lang.upper()} model not available")
-        
+                log.debug("   ⚠️ %s model not available", original_lang.upper())
+
         # Step 2: Extract from translated English text
         if debug:
-            print("\n2️⃣ Extracting from translated English text...")
-        
-        english_spacy_entities = self.extract_all_entities_spacy(translated_text, "en")
-        english_person_regex = self.extract_person_entities_regex(translated_text, "en")
-        
-        if debug:
-            print(f"   English spaCy entities: {len(english_spacy_entities)}")
-            print(f"   English person regex: {len(english_person_regex)}")
-        
-        all_entities.extend(english_spacy_entities)
-        all_entities.extend(english_person_regex)
-        
+            log.debug("\n2️⃣ Extracting from translated English text...")
+
+        if skip_translated:
+            if debug:
+                log.debug("   ⏭️ Translated text identical to original, reusing step 1 results")
+        else:
+            english_person_regex = self.extract_person_entities_regex(translated_text, "en")
+
+            if debug:
+                log.debug("   English spaCy entities: %d", len(english_spacy_entities))
+                log.debug("   English person regex: %d", len(english_person_regex))
+
+            raw_count += len(english_spacy_entities) + len(english_person_regex)
+            self._accumulate(english_spacy_entities, acc)
+            self._accumulate(english_person_regex, acc)
+
         # Step 3: Clean and deduplicate
         if debug:
-            print("\n3️⃣ Cleaning and deduplicating...")
-        
-        final_entities = self.clean_and_deduplicate_entities(all_entities)
-        
+            log.debug("\n3️⃣ Cleaning and deduplicating...")
+
+        final_entities = sorted(acc.values(), key=lambda x: (x.entity_type, x.confidence), reverse=True)
+
         return {
             'all_entities': final_entities,
             'person_entities': [e for e in final_entities if e.entity_type in ['PERSON', 'PER']],
@@ -299,8 +505,9 @@ class EnhancedMultilingualNER:
             'other_entities': [e for e in final_entities if e.entity_type not in ['PERSON', 'PER', 'ORG', 'ORGANIZATION']],
             'total_entities_found': len(final_entities),
             'processing_stats': {
-                'total_raw_entities': len(all_entities),
+                'total_raw_entities': raw_count,
                 'after_deduplication': len(final_entities),
+                'translated_pass_skipped': skip_translated,
                 'available_languages': self.available_languages
             }
         }
@@ -315,17 +522,21 @@ class LLMReadyPipeline:
         print("✅ LLM-ready pipeline initialized!")
         print(f"📍 Supported languages: {', '.join(self.ner.available_languages)}")
     
-    def process_for_llm(self, file_path: str, target_name: str, debug: bool = True) -> Dict:
-        """Process file and return LLM-ready data structure"""
+    def process_for_llm(self, file_path: str, target_name: str, debug: bool = True,
+                        data: bytes = None) -> Dict:
+        """Process file and return LLM-ready data structure.
+
+        Pass pre-read file bytes via data to avoid a second disk read.
+        """
         print(f"\n{'='*80}")
         print("🤖 LLM-READY PROCESSING PIPELINE")
         print(f"File: {file_path}")
         print(f"Target: {target_name}")
         print(f"{'='*80}")
-        
+
         # Step 1: Translation phase
         print("\n📖 Reading and translating file...")
-        text = self.translator.read_file(file_path)
+        text = self.translator.read_file(file_path, data=data)
         detected_lang = self.translator.detect_language(text)
         english_text = self.translator.translate_to_english(text, detected_lang)
         
@@ -354,53 +565,128 @@ class LLMReadyPipeline:
             'extraction_result': extraction_result
         }
     
-    def _display_llm_content(self, original_text: str, translated_text: str, 
+    # Multiprocessing only pays off once enough documents share a batch;
+    # each forked worker carries its own copy of the loaded models
+    MULTIPROCESS_THRESHOLD = 8
+
+    def process_batch(self, file_paths: List[str], target_names: List[str], debug: bool = False) -> List[Dict]:
+        """Process many files in one pass, sharing spaCy batches across documents"""
+        if debug:
+            _enable_debug_logging()
+        print(f"\n📦 Batch processing {len(file_paths)} files...")
+
+        # Phase 1: read and translate sequentially (I/O + translation models)
+        texts, english_texts, langs = [], [], []
+        for file_path in file_paths:
+            text = self.translator.read_file(file_path)
+            detected_lang = self.translator.detect_language(text)
+            english_texts.append(self.translator.translate_to_english(text, detected_lang))
+            texts.append(text)
+            langs.append(detected_lang)
+
+        # Phase 2: one spaCy pass over every document (original + translated),
+        # multiprocessed only when the batch is big enough to amortize workers
+        requests = []
+        for text, english_text, lang in zip(texts, english_texts, langs):
+            requests.append((text, lang))
+            requests.append((english_text, 'en'))
+
+        n_process = 1
+        if len(requests) >= self.MULTIPROCESS_THRESHOLD:
+            n_process = max(1, (os.cpu_count() or 2) - 1)
+        spacy_results = self.ner.extract_batch(requests, n_process=n_process)
+
+        # Phase 3: per-file regex extraction, dedup and assembly
+        results = []
+        for i, (file_path, target_name) in enumerate(zip(file_paths, target_names)):
+            text, english_text, lang = texts[i], english_texts[i], langs[i]
+
+            all_entities = list(spacy_results[2 * i]) + list(spacy_results[2 * i + 1])
+            if lang in self.ner.available_languages:
+                all_entities.extend(self.ner.extract_person_entities_regex(text, lang))
+            all_entities.extend(self.ner.extract_person_entities_regex(english_text, 'en'))
+
+            final_entities = self.ner.clean_and_deduplicate_entities(all_entities)
+            extraction_result = {
+                'all_entities': final_entities,
+                'person_entities': [e for e in final_entities if e.entity_type in ['PERSON', 'PER']],
+                'organization_entities': [e for e in final_entities if e.entity_type in ['ORG', 'ORGANIZATION']],
+                'other_entities': [e for e in final_entities if e.entity_type not in ['PERSON', 'PER', 'ORG', 'ORGANIZATION']],
+                'total_entities_found': len(final_entities),
+                'processing_stats': {
+                    'total_raw_entities': len(all_entities),
+                    'after_deduplication': len(final_entities),
+                    'available_languages': self.ner.available_languages
+                }
+            }
+
+            if debug:
+                self._display_llm_content(text, english_text, extraction_result, lang, target_name)
+
+            results.append({
+                'target_name': target_name,
+                'original_text': text,
+                'translated_text': english_text,
+                'detected_language': lang,
+                'extraction_result': extraction_result
+            })
+
+        print(f"✅ Batch complete: {len(results)} files processed")
+        return results
+
+    def _display_llm_content(self, original_text: str, translated_text: str,
                            extraction_result: Dict, detected_lang: str, target_name: str):
-        """Display content in LLM-ready format"""
-        
-        print(f"\n{'='*80}")
-        print("📝 LLM INPUT CONTENT")
-        print(f"{'='*80}")
-        
-        print(f"\n🎯 TARGET NAME: {target_name}")
-        
-        print(f"\n📄 ORIGINAL ARTICLE ({detected_lang.upper()}):")
-        print("─" * 80)
-        print(original_text)
-        print("─" * 80)
-        
-        print("\n🌐 TRANSLATED ARTICLE (ENGLISH):")
-        print("─" * 80)
-        print(translated_text)
-        print("─" * 80)
-        
-        print("\n👥 ALL ENTITIES FOUND IN ARTICLE:")
-        print("─" * 80)
-        
+        """Display content in LLM-ready format (debug logging only)"""
+        if not log.isEnabledFor(logging.DEBUG):
+            # Skip all per-entity formatting when nobody is listening
+            return
+
+        bar = '=' * 80
+        rule = '─' * 80
+
+        log.debug("\n%s", bar)
+        log.debug("📝 LLM INPUT CONTENT")
+        log.debug("%s", bar)
+
+        log.debug("\n🎯 TARGET NAME: %s", target_name)
+
+        log.debug("\n📄 ORIGINAL ARTICLE (%s):", detected_lang.upper())
+        log.debug("%s", rule)
+        log.debug("%s", original_text)
+        log.debug("%s", rule)
+
+        log.debug("\n🌐 TRANSLATED ARTICLE (ENGLISH):")
+        log.debug("%s", rule)
+        log.debug("%s", translated_text)
+        log.debug("%s", rule)
+
+        log.debug("\n👥 ALL ENTITIES FOUND IN ARTICLE:")
+        log.debug("%s", rule)
+
         entities = extraction_result['all_entities']
         if entities:
             for i, entity in enumerate(entities, 1):
-                print(f"{i}. NAME: '{entity.name}'")
-                print(f"   TYPE: {entity.entity_type}")
-                print(f"   CONFIDENCE: {entity.confidence:.2f}")
-                print(f"   SOURCE: {entity.source} (language: {entity.language})")
-                print(f"   CONTEXT: \"{entity.context[:100]}...\"")
-                print()
+                log.debug("%d. NAME: '%s'", i, entity.name)
+                log.debug("   TYPE: %s", entity.entity_type)
+                log.debug("   CONFIDENCE: %.2f", entity.confidence)
+                log.debug("   SOURCE: %s (language: %s)", entity.source, entity.language)
+                log.debug("   CONTEXT: \"%s...\"", entity.context[:100])
+                log.debug("")
         else:
-            print("No entities found in the article.")
-        
-        print("─" * 80)
-        
+            log.debug("No entities found in the article.")
+
+        log.debug("%s", rule)
+
         # Summary statistics
         person_count = len(extraction_result['person_entities'])
         org_count = len(extraction_result['organization_entities'])
         other_count = len(extraction_result['other_entities'])
-        
-        print("\n📊 ENTITY SUMMARY:")
-        print(f"   👥 Persons: {person_count}")
-        print(f"   🏢 Organizations: {org_count}")
-        print(f"   🔖 Other entities: {other_count}")
-        print(f"   📍 Total entities: {extraction_result['total_entities_found']}")
+
+        log.debug("\n📊 ENTITY SUMMARY:")
+        log.debug("   👥 Persons: %d", person_count)
+        log.debug("   🏢 Organizations: %d", org_count)
+        log.debug("   🔖 Other entities: %d", other_count)
+        log.debug("   📍 Total entities: %d", extraction_result['total_entities_found'])
 
 def main():
     """LLM-ready command line interface"""
@@ -12,36 +12,83 @@ Example:
 """
 
 import argparse
+import asyncio
+import glob
+import hashlib
+import io
+import logging
+import mmap
 import sys
 import os
 import json
 import traceback
 
-# Import our pipeline components - CORRECTED IMPORTS
+# Debug output goes through logging so disabled levels short-circuit before
+# any f-string formatting happens
+log = logging.getLogger("name_matcher_tool")
+
+def _enable_debug_logging():
+    """Route log.debug to stderr for callers passing debug=True"""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+    log.setLevel(logging.DEBUG)
+
+# Banner rules built once; the daemon mode reprints these per job
+_BAR80 = '=' * 80
+_BAR50 = '\u2500' * 50
+
+# Inputs past this size get a warning before the pipeline starts
+_MAX_FILE_BYTES = 3 * 1024 * 1024
+
+# Optional: blake3 hashes large articles several times faster than sha256
+try:
+    from blake3 import blake3 as _content_hash
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    _content_hash = hashlib.sha256
+    BLAKE3_AVAILABLE = False
+
+# Optional: orjson serializes results several times faster than stdlib json
 try:
-    from ner_pipeline_overall import LLMReadyPipeline  # Changed from MultilingualIntegratedPipeline
-    from llm_matching import RegulatoryLLMMatcher      # Changed from clean_llm_matcher
-except ImportError as e:
-    print(f"❌ Error importing pipeline components: {e}")
-    print("Make sure ner_pipeline_overall.py and llm_matching.py are in the same directory")
-    print("Required classes: LLMReadyPipeline, RegulatoryLLMMatcher")
-    sys.exit(1)
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 class NameMatcherPipeline:
     """Complete Name Matcher AI adverse media screening pipeline"""
     
-    def __init__(self, openai_api_key=None, debug=False):
+    def __init__(self, openai_api_key=None, debug=False,
+                 cache_dir='~/.cache/name_matcher', use_cache=True):
         """Initialize the complete pipeline"""
         self.debug = debug
-        
-        if self.debug:
-            print("🚀 Initializing Name Matcher AI Pipeline...")
-        
+        if debug:
+            _enable_debug_logging()
+
+        # Content-addressed results cache: re-screening the same
+        # (article bytes, target) pair becomes one disk read
+        self.cache_dir = os.path.expanduser(cache_dir) if use_cache and cache_dir else None
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+        log.debug("🚀 Initializing Name Matcher AI Pipeline...")
+
+        # Pipeline components are imported here, not at module top, so
+        # --help and input validation never pay the spaCy/transformers
+        # import cost
+        try:
+            from ner_pipeline_overall import LLMReadyPipeline  # Changed from MultilingualIntegratedPipeline
+            from llm_matching import RegulatoryLLMMatcher      # Changed from clean_llm_matcher
+        except ImportError as e:
+            print(f"❌ Error importing pipeline components: {e}")
+            print("Make sure ner_pipeline_overall.py and llm_matching.py are in the same directory")
+            print("Required classes: LLMReadyPipeline, RegulatoryLLMMatcher")
+            raise
+
         # Initialize NER pipeline - CORRECTED CLASS NAME
         try:
             self.ner_pipeline = LLMReadyPipeline()  # Changed from MultilingualIntegratedPipeline
-            if self.debug:
-                print("✅ NER Pipeline initialized")
+            log.debug("✅ NER Pipeline initialized")
         except Exception as e:
             print(f"❌ Failed to initialize NER pipeline: {e}")
             raise
@@ -49,77 +96,97 @@ class NameMatcherPipeline:
         # Initialize LLM matcher
         try:
             self.llm_matcher = RegulatoryLLMMatcher(api_key=openai_api_key)
-            if self.debug:
-                print("✅ LLM Matcher initialized")
+            log.debug("✅ LLM Matcher initialized")
         except Exception as e:
             print(f"❌ Failed to initialize LLM matcher: {e}")
             raise
         
-        if self.debug:
-            print("🎯 Pipeline ready for adverse media screening!")
+        log.debug("🎯 Pipeline ready for adverse media screening!")
+
+    def warm_up(self):
+        """Prime the OpenAI connection pool with a one-token ping.
+
+        The first real call otherwise pays TCP + TLS setup (~300 ms);
+        the matcher's keep-alive pool then reuses the warmed connection
+        for the actual screening calls.
+        """
+        if not getattr(self.llm_matcher, 'use_openai', False) or self.llm_matcher.client is None:
+            return
+        try:
+            self.llm_matcher.client.chat.completions.create(
+                model=self.llm_matcher.model,
+                messages=[{'role': 'user', 'content': 'ping'}],
+                max_tokens=1,
+                timeout=10
+            )
+            log.debug("🔥 OpenAI connection warmed")
+        except Exception as e:
+            log.debug("⚠️  Warm-up ping failed: %s", e)
     
     def process_file(self, file_path, target_name):
         """
         Process a file through the complete pipeline
-        
+
         Args:
             file_path: Path to text/RTF file
-            target_name: Name to search for
-            
+            target_name: Name to search for, or a list of names — a list
+                is screened with one multi-target LLM call instead of one
+                article-sized prompt per name
+
         Returns:
             dict: Complete results with all pipeline stages
+                (a list of dicts, one per name, when target_name is a list)
         """
-        if self.debug:
-            print(f"\n{'='*80}")
-            print("📋 NAME MATCHER AI ADVERSE MEDIA SCREENING")
-            print(f"{'='*80}")
-            print(f"File: {file_path}")
-            print(f"Target: {target_name}")
-            print(f"{'='*80}")
-        
+        multi = isinstance(target_name, (list, tuple))
+        targets = list(target_name) if multi else [target_name]
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("\n%s", _BAR80)
+            log.debug("📋 NAME MATCHER AI ADVERSE MEDIA SCREENING")
+            log.debug("%s", _BAR80)
+            log.debug("File: %s", file_path)
+            log.debug("Target: %s", ', '.join(targets))
+            log.debug("%s", _BAR80)
+
+        cache_path, cached, file_bytes = self._cache_lookup(file_path, '\n'.join(targets))
+        if cached is not None:
+            log.debug("✅ Cache hit - returning stored screening results")
+            return cached
+
         # Step 1: NER Pipeline (Translation + Entity Extraction) - CORRECTED METHOD NAME
-        if self.debug:
-            print("\n🔄 STEP 1: Running NER Pipeline...")
-        
-        try:
-            # Changed method name to match actual implementation
-            ner_result = self.ner_pipeline.process_for_llm(file_path, target_name, debug=self.debug)
-            
-            # Extract data from the result structure
-            ner_data = {
-                'target_name': ner_result['target_name'],
-                'original_text': ner_result['original_text'],
-                'translated_text': ner_result['translated_text'],
-                'detected_language': ner_result['detected_language'],
-                'entities': self._convert_entities_to_person_format(ner_result['extraction_result']['all_entities'])
-            }
-            
-            if self.debug:
-                print("✅ NER Pipeline complete:")
-                print(f"   Language: {ner_data['detected_language']}")
-                print(f"   Original text: {len(ner_data['original_text'])} chars")
-                print(f"   Translated text: {len(ner_data['translated_text'])} chars")
-                print(f"   Entities extracted: {len(ner_data['entities'])}")
-                
-                # Show top person entities
-                person_entities = [e for e in ner_data['entities'] 
-                                 if any(keyword in e.source.lower() 
-                                       for keyword in ['person', 'per', 'people'])]
-                if person_entities:
-                    print("   Person entities found:")
-                    for i, entity in enumerate(person_entities[:5], 1):
-                        print(f"     {i}. {entity.name} (conf: {entity.confidence:.2f})")
-                
-        except Exception as e:
-            print(f"❌ NER Pipeline failed: {e}")
-            if self.debug:
-                traceback.print_exc()
-            return {"error": f"NER Pipeline failed: {e}"}
-        
+        log.debug("\n🔄 STEP 1: Running NER Pipeline...")
+
+        ner_data = self._run_ner_stage(file_path, targets[0], data=file_bytes)
+        # Text extraction has copied what it needs; release the mapping
+        if isinstance(file_bytes, mmap.mmap):
+            file_bytes.close()
+        if "error" in ner_data:
+            return ner_data
+
         # Step 2: LLM Matching
-        if self.debug:
-            print(f"\n🔄 STEP 2: Running LLM Matching...")
-        
+        log.debug("\n🔄 STEP 2: Running LLM Matching...")
+
+        if multi:
+            try:
+                llm_results = self.llm_matcher.match_multi(
+                    target_names=targets,
+                    original_text=ner_data['original_text'],
+                    translated_text=ner_data['translated_text'],
+                    entities=ner_data['entities'],
+                    detected_language=ner_data['detected_language'],
+                    debug=self.debug
+                )
+            except Exception as e:
+                print(f"❌ LLM Matching failed: {e}")
+                if self.debug:
+                    traceback.print_exc()
+                return {"error": f"LLM Matching failed: {e}"}
+
+            final_results = [self._compile_results(file_path, target, ner_data, result)
+                             for target, result in zip(targets, llm_results)]
+            self._cache_store(cache_path, final_results)
+            return final_results
+
         try:
             llm_result = self.llm_matcher.match_with_full_context(
                 target_name=ner_data['target_name'],
@@ -129,30 +196,203 @@ class NameMatcherPipeline:
                 detected_language=ner_data['detected_language'],
                 debug=self.debug
             )
-            
-            if self.debug:
-                print("✅ LLM Matching complete:")
-                print(f"   Result: {llm_result.result}")
-                print(f"   Confidence: {llm_result.confidence:.2f}")
-                print(f"   Method: {llm_result.method}")
-        
+
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("✅ LLM Matching complete:")
+                log.debug("   Result: %s", llm_result.result)
+                log.debug("   Confidence: %.2f", llm_result.confidence)
+                log.debug("   Method: %s", llm_result.method)
+
         except Exception as e:
             print(f"❌ LLM Matching failed: {e}")
             if self.debug:
                 traceback.print_exc()
             return {"error": f"LLM Matching failed: {e}"}
-        
+
         # Step 3: Compile Final Results
-        final_results = {
+        final_results = self._compile_results(file_path, target_name, ner_data, llm_result)
+        self._cache_store(cache_path, final_results)
+        return final_results
+
+    async def process_files_async(self, file_target_pairs, concurrency=4):
+        """
+        Process many (file_path, target_name) pairs concurrently.
+
+        The CPU-bound NER stage runs in worker threads while the LLM
+        round-trips are awaited together, so total wall time approaches
+        the slowest file instead of the sum of all API latencies. The
+        matcher's own rate limiter still caps requests/tokens per minute;
+        the semaphore here just bounds how many files are in flight.
+
+        Returns:
+            list: One results dict per input pair, in input order
+        """
+        sem = asyncio.Semaphore(max(1, concurrency))
+
+        async def _one(file_path, target_name):
+            async with sem:
+                cache_path, cached, file_bytes = await asyncio.to_thread(
+                    self._cache_lookup, file_path, target_name)
+                if cached is not None:
+                    return cached
+
+                # Kick NER off in a worker thread, then build the
+                # NER-independent LLM-side setup (async client/HTTP pool
+                # construction on the first job) before awaiting it instead
+                # of paying for that on the first API call. The client is
+                # created directly on the event loop - no I/O happens until
+                # the first request, and the loop-keyed cache must see this
+                # loop, not a worker thread's missing one.
+                ner_task = asyncio.create_task(asyncio.to_thread(
+                    self._run_ner_stage, file_path, target_name, file_bytes))
+                if getattr(self.llm_matcher, 'use_openai', False):
+                    try:
+                        self.llm_matcher._get_async_client()
+                    except Exception:
+                        pass  # falls back exactly as the matching call would
+
+                ner_data = await ner_task
+                # Text extraction has copied what it needs; release the mapping
+                if isinstance(file_bytes, mmap.mmap):
+                    file_bytes.close()
+                if "error" in ner_data:
+                    return ner_data
+                try:
+                    llm_result = await self.llm_matcher.match_with_full_context_async(
+                        target_name=ner_data['target_name'],
+                        original_text=ner_data['original_text'],
+                        translated_text=ner_data['translated_text'],
+                        entities=ner_data['entities'],
+                        detected_language=ner_data['detected_language'],
+                        debug=self.debug
+                    )
+                except Exception as e:
+                    return {"error": f"LLM Matching failed: {e}",
+                            "file_path": file_path, "target_name": target_name}
+                final_results = self._compile_results(file_path, target_name, ner_data, llm_result)
+                self._cache_store(cache_path, final_results)
+                return final_results
+
+        return list(await asyncio.gather(
+            *[_one(path, target) for path, target in file_target_pairs]))
+
+    def process_files(self, file_target_pairs, concurrency=4):
+        """Synchronous wrapper around process_files_async"""
+        return asyncio.run(self.process_files_async(file_target_pairs, concurrency=concurrency))
+
+    def _cache_lookup(self, file_path, target_name):
+        """Return (cache_path, cached_results_or_None, file_bytes) for this job.
+
+        The raw bytes are handed back so the NER stage can reuse them —
+        hashing and text extraction share one disk read.
+        """
+        if not self.cache_dir:
+            return None, None, None
+        file_view = None
+        try:
+            # Memory-map instead of read(): the hash walks the mapping in
+            # place and the same view feeds the NER stage, so the file
+            # contents are never copied into an intermediate bytes object
+            with open(file_path, 'rb') as f:
+                try:
+                    file_view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    # Empty or unmappable file - fall back to a plain read
+                    file_view = f.read()
+
+            # The article length is hashed first so the article/target field
+            # boundary is unambiguous: ("AB", "C") and ("A", "BC") must not
+            # produce the same key
+            hasher = _content_hash()
+            hasher.update(len(file_view).to_bytes(8, 'little'))
+            hasher.update(file_view)
+            hasher.update(target_name.encode('utf-8'))
+            key = hasher.hexdigest()
+
+            cache_path = os.path.join(self.cache_dir, key + '.json')
+            if os.path.exists(cache_path):
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+                # A hit skips the NER stage, so the mapping is done with
+                if isinstance(file_view, mmap.mmap):
+                    file_view.close()
+                return cache_path, cached, None
+            return cache_path, None, file_view
+        except Exception:
+            # A broken cache entry must never break screening
+            if isinstance(file_view, mmap.mmap):
+                file_view.close()
+            return None, None, None
+
+    def _cache_store(self, cache_path, results):
+        """Persist successful results under their content hash"""
+        if not cache_path:
+            return
+        if isinstance(results, dict):
+            if "error" in results:
+                return
+        elif any("error" in r for r in results):
+            return
+        try:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False)
+        except OSError:
+            pass
+
+    def _run_ner_stage(self, file_path, target_name, data=None):
+        """Run translation + entity extraction; returns ner_data or an error dict"""
+        try:
+            ner_result = self.ner_pipeline.process_for_llm(file_path, target_name,
+                                                           debug=self.debug, data=data)
+
+            # Extract data from the result structure; conversion, the
+            # person filter and text lengths all happen once here and are
+            # reused downstream (including per target in multi-target mode)
+            entities, persons = self._convert_entities_to_person_format(
+                ner_result['extraction_result']['all_entities'])
+            ner_data = {
+                'target_name': ner_result['target_name'],
+                'original_text': ner_result['original_text'],
+                'translated_text': ner_result['translated_text'],
+                'detected_language': ner_result['detected_language'],
+                'entities': entities,
+                'person_entities': persons,
+                'original_text_length': len(ner_result['original_text']),
+                'translated_text_length': len(ner_result['translated_text'])
+            }
+
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("✅ NER Pipeline complete:")
+                log.debug("   Language: %s", ner_data['detected_language'])
+                log.debug("   Original text: %d chars", ner_data['original_text_length'])
+                log.debug("   Translated text: %d chars", ner_data['translated_text_length'])
+                log.debug("   Entities extracted: %d", len(ner_data['entities']))
+
+                # Show top person entities
+                person_entities = ner_data['person_entities']
+                if person_entities:
+                    log.debug("   Person entities found:")
+                    for i, entity in enumerate(person_entities[:5], 1):
+                        log.debug("     %d. %s (conf: %.2f)", i, entity.name, entity.confidence)
+
+            return ner_data
+
+        except Exception as e:
+            print(f"❌ NER Pipeline failed: {e}")
+            if self.debug:
+                traceback.print_exc()
+            return {"error": f"NER Pipeline failed: {e}"}
+
+    def _compile_results(self, file_path, target_name, ner_data, llm_result):
+        """Assemble the final results dict from the pipeline stages"""
+        return {
             "file_path": file_path,
             "target_name": target_name,
             "detected_language": ner_data['detected_language'],
-            "original_text_length": len(ner_data['original_text']),
-            "translated_text_length": len(ner_data['translated_text']),
+            "original_text_length": ner_data['original_text_length'],
+            "translated_text_length": ner_data['translated_text_length'],
             "entities_found": len(ner_data['entities']),
-            "person_entities_found": len([e for e in ner_data['entities'] 
-                                        if any(keyword in e.source.lower() 
-                                              for keyword in ['person', 'per'])]),
+            "person_entities_found": len(ner_data['person_entities']),
             "match_result": llm_result.result,
             "match_confidence": llm_result.confidence,
             "match_explanation": llm_result.explanation,
@@ -160,32 +400,43 @@ class NameMatcherPipeline:
             "entities_analyzed": llm_result.entities_analyzed,
             "pipeline_version": "NameMatcher_AI_v1.0"
         }
-        
-        return final_results
-    
+
+
     def _convert_entities_to_person_format(self, entities):
-        """Convert Entity objects to PersonEntity format expected by LLM matcher"""
-        from llm_matching import PersonEntity
-        
-        converted_entities = []
-        for entity in entities:
+        """Convert Entity objects to PersonEntity format expected by LLM matcher.
+
+        Returns (converted, persons): the person sublist is classified in
+        the same pass, so callers never re-traverse the full list.
+        """
+        # PERSON_SOURCE_RE is shared with the LLM matcher's own entity
+        # filter, so both classify person sources identically
+        from llm_matching import PersonEntity, PERSON_SOURCE_RE
+
+        converted = []
+        persons = []
+        if not entities:
+            return converted, persons
+
+        # Upstream Entity always carries char offsets, so probe once and
+        # hoist the getattr fallback out of the per-entity loop
+        has_offsets = hasattr(entities[0], 'start_char')
+        for e in entities:
             person_entity = PersonEntity(
-                name=entity.name,
-                confidence=entity.confidence,
-                source=entity.source,
-                context=entity.context,
-                start_char=getattr(entity, 'start_char', 0),
-                end_char=getattr(entity, 'end_char', 0)
+                name=e.name, confidence=e.confidence, source=e.source,
+                context=e.context,
+                start_char=e.start_char if has_offsets else 0,
+                end_char=e.end_char if has_offsets else 0
             )
-            converted_entities.append(person_entity)
-        
-        return converted_entities
+            converted.append(person_entity)
+            if PERSON_SOURCE_RE.search(person_entity._source_lc):
+                persons.append(person_entity)
+        return converted, persons
     
     def print_final_summary(self, results):
         """Print a clean final summary"""
-        print(f"\n{'='*80}")
+        print("\n" + _BAR80)
         print("📊 FINAL NAME MATCHER AI SCREENING RESULTS")
-        print(f"{'='*80}")
+        print(_BAR80)
         
         if "error" in results:
             print(f"❌ Error: {results['error']}")
@@ -198,9 +449,9 @@ class NameMatcherPipeline:
         print(f"📝 Text processed: {results['original_text_length']} → {results['translated_text_length']} chars")
         print(f"👥 Entities found: {results['entities_found']} total, {results['person_entities_found']} persons")
         
-        print(f"\n{'─'*50}")
+        print("\n" + _BAR50)
         print("🎯 MATCH DECISION")
-        print(f"{'─'*50}")
+        print(_BAR50)
         
         # Match result with color coding
         result = results['match_result']
@@ -233,7 +484,68 @@ class NameMatcherPipeline:
         else:
             print("   ✅ Conservative screening applied - low false negative risk")
         
-        print(f"\n{'='*80}")
+        print("\n" + _BAR80)
+
+def _write_output(output_path, results):
+    """Persist results: one JSON object per line for batches (so downstream
+    jq/grep pipelines work incrementally), pretty-printed JSON for a single file"""
+    if isinstance(results, list):
+        if ORJSON_AVAILABLE:
+            with open(output_path, 'wb') as f:
+                for result in results:
+                    f.write(orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS))
+                    f.write(b'\n')
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                for result in results:
+                    f.write(json.dumps(result, ensure_ascii=False))
+                    f.write('\n')
+    else:
+        if ORJSON_AVAILABLE:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(results,
+                                     option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"\n💾 Results saved to: {output_path}")
+
+def run_serve_loop(pipeline, out=None):
+    """
+    Daemon mode: keep the pipeline resident and process jobs from stdin.
+
+    Each input line is a JSON job {"file": ..., "target": ...}; each
+    output line is the results dict for that job. Models load once at
+    startup instead of once per invocation, which dominates wall-clock
+    time for short articles.
+
+    `out` is the stream results are written to. main() hands over the
+    real stdout and points sys.stdout at stderr for the daemon's
+    lifetime, so the pipeline's human-readable print chatter cannot
+    interleave with the JSONL stream a consumer is parsing.
+    """
+    if out is None:
+        out = sys.stdout
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    # Read job lines as bytes through a 64KB buffer: orjson/json parse
+    # bytes directly, skipping the text-mode decode of every line
+    raw_stdin = getattr(sys.stdin.buffer, 'raw', sys.stdin.buffer)
+    reader = io.BufferedReader(raw_stdin, buffer_size=65536)
+    for line in iter(reader.readline, b''):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            job = loads(line)
+            results = pipeline.process_file(job['file'], job['target'])
+        except Exception as e:
+            results = {"error": f"Job failed: {e}"}
+        if ORJSON_AVAILABLE:
+            out.write(orjson.dumps(results).decode('utf-8') + '\n')
+        else:
+            out.write(json.dumps(results, ensure_ascii=False) + '\n')
+        out.flush()
+
 
 def main():
     """Command-line interface"""
@@ -255,18 +567,29 @@ Examples:
   name_matcher_tool data/french_article.rtf "Marie Dubois" --debug
   name_matcher_tool data/german_article.rtf "Klaus Mueller" --api-key sk-proj-...
   name_matcher_tool data/spanish_article.txt "Carlos Rodriguez" --output results.json
-  
+  name_matcher_tool "data/*.rtf" "Carlos Rodriguez" --output results.jsonl
+
   # With environment variable (recommended):
   export OPENAI_API_KEY="sk-proj-your-key-here"
   name_matcher_tool my_article.rtf "Target Person" --debug
         """
     )
     
-    parser.add_argument('file_path', 
-                       help='Path to article file (TXT, RTF supported; PDF can be added), recommended <3,000 words')
-    parser.add_argument('target_name', 
+    parser.add_argument('file_path', nargs='*',
+                       help='Article file(s) to screen - accepts globs like "data/*.rtf" '
+                            '(TXT, RTF supported; PDF can be added), recommended <3,000 words each')
+    parser.add_argument('target_name', nargs='?',
                        help='Name of the individual to search for in the article')
-    parser.add_argument('--debug', 
+    parser.add_argument('--input-manifest',
+                       help='JSONL manifest of {"file": ..., "target": ...} jobs to process concurrently')
+    parser.add_argument('--serve',
+                       action='store_true',
+                       help='Run as a resident daemon reading JSONL jobs from stdin (models load once)')
+    parser.add_argument('--concurrency',
+                       type=int,
+                       default=4,
+                       help='Max files in flight when using --input-manifest (default: 4)')
+    parser.add_argument('--debug',
                        action='store_true',
                        help='Enable debug output')
     parser.add_argument('--api-key', 
@@ -276,43 +599,158 @@ Examples:
     parser.add_argument('--model',
                        default='gpt-3.5-turbo',
                        help='OpenAI model to use (default: gpt-3.5-turbo)')
+    parser.add_argument('--no-cache',
+                       action='store_true',
+                       help='Disable the on-disk results cache')
+    parser.add_argument('--cache-dir',
+                       default='~/.cache/name_matcher',
+                       help='Results cache location (default: ~/.cache/name_matcher)')
+    parser.add_argument('--warm',
+                       action='store_true',
+                       help='Prime the OpenAI connection with a 1-token ping before screening')
     
     args = parser.parse_args()
-    
+
     # Validate inputs
-    if not os.path.exists(args.file_path):
-        print(f"❌ Error: File not found: {args.file_path}")
-        sys.exit(1)
-    
-    if not args.target_name.strip():
-        print("❌ Error: Target name cannot be empty")
-        sys.exit(1)
-    
+    if args.serve:
+        pass  # jobs arrive on stdin
+    elif args.input_manifest:
+        if not os.path.exists(args.input_manifest):
+            print(f"❌ Error: Manifest not found: {args.input_manifest}")
+            sys.exit(1)
+    else:
+        # file_path is greedy, so the trailing positional is the target name
+        if args.target_name is None and len(args.file_path) >= 2:
+            args.target_name = args.file_path.pop()
+
+        if not args.file_path or not args.target_name:
+            print("❌ Error: file_path and target_name are required (or use --input-manifest)")
+            sys.exit(1)
+
+        if not args.target_name.strip():
+            print("❌ Error: Target name cannot be empty")
+            sys.exit(1)
+
+        # Expand quoted globs and directories; a pattern that matches nothing
+        # falls through as a literal path so the stat below reports it
+        paths = []
+        for pattern in args.file_path:
+            matched = sorted(glob.glob(pattern))
+            for path in (matched or [pattern]):
+                if os.path.isdir(path):
+                    paths.extend(sorted(p for p in glob.glob(os.path.join(path, '*'))
+                                        if os.path.isfile(p)))
+                else:
+                    paths.append(path)
+
+        if not paths:
+            print(f"❌ Error: No files matched: {' '.join(args.file_path)}")
+            sys.exit(1)
+
+        # One stat per file covers existence, the empty-file short-circuit and
+        # the size warning (instead of exists() checks plus later opens)
+        empty_results = []
+        screened_paths = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                print(f"❌ Error: File not found: {path}")
+                sys.exit(1)
+
+            if st.st_size == 0:
+                # An empty article cannot mention anyone - skip the pipeline
+                print(f"⚠️  File is empty: {path}")
+                empty_results.append({
+                    "file_path": path,
+                    "target_name": args.target_name,
+                    "match_result": "NO_MATCH",
+                    "match_confidence": 1.0,
+                    "match_explanation": "File is empty - no article text to screen",
+                    "match_method": "empty-file short-circuit",
+                    "entities_found": 0,
+                    "person_entities_found": 0,
+                    "entities_analyzed": [],
+                    "pipeline_version": "NameMatcher_AI_v1.0"
+                })
+                continue
+
+            if st.st_size > _MAX_FILE_BYTES:
+                print(f"⚠️  Warning: {path} is {st.st_size / 1048576:.1f} MB "
+                      f"(recommended < {_MAX_FILE_BYTES // 1048576} MB); processing may be slow")
+            screened_paths.append(path)
+
+        if not screened_paths:
+            # Every input was empty - no pipeline startup needed
+            results = empty_results[0] if len(empty_results) == 1 else empty_results
+            if args.output:
+                _write_output(args.output, results)
+            sys.exit(0)
+
     # Initialize and run pipeline
     try:
+        serve_out = None
+        if args.serve:
+            # Reserve the real stdout for the JSONL results stream; init
+            # banners and per-job progress prints all route to stderr
+            serve_out = sys.stdout
+            sys.stdout = sys.stderr
+
         pipeline = NameMatcherPipeline(
             openai_api_key=args.api_key,
-            debug=args.debug
+            debug=args.debug,
+            cache_dir=args.cache_dir,
+            use_cache=not args.no_cache
         )
-        
-        results = pipeline.process_file(args.file_path, args.target_name)
-        
-        # Print summary
-        pipeline.print_final_summary(results)
-        
+
+        if args.warm:
+            pipeline.warm_up()
+
+        if args.serve:
+            run_serve_loop(pipeline, serve_out)
+            sys.exit(0)
+
+        if args.input_manifest:
+            # Fan the manifest jobs out concurrently; one pipeline instance
+            # serves them all, so models load once
+            pairs = []
+            with open(args.input_manifest, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        job = json.loads(line)
+                        pairs.append((job['file'], job['target']))
+
+            results = pipeline.process_files(pairs, concurrency=args.concurrency)
+
+            for result in results:
+                pipeline.print_final_summary(result)
+        elif len(screened_paths) == 1 and not empty_results:
+            results = pipeline.process_file(screened_paths[0], args.target_name)
+
+            # Print summary
+            pipeline.print_final_summary(results)
+        else:
+            # One pipeline instance screens the whole batch, so models load
+            # once instead of once per file
+            batch_results = pipeline.process_files(
+                [(path, args.target_name) for path in screened_paths],
+                concurrency=args.concurrency
+            )
+
+            for result in batch_results:
+                pipeline.print_final_summary(result)
+
+            results = batch_results + empty_results
+
         # Save to file if requested
         if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
-            print(f"\n💾 Results saved to: {args.output}")
-        
-        # Exit with appropriate code
-        if "error" in results:
-            sys.exit(1)
-        elif results.get('match_result') == 'MATCH':
-            sys.exit(0)  # Match found - success
-        else:
-            sys.exit(0)  # No match - also success
+            _write_output(args.output, results)
+
+        # Exit with appropriate code: errors fail, any verdict succeeds
+        if isinstance(results, list):
+            sys.exit(1 if any("error" in r for r in results) else 0)
+        sys.exit(1 if "error" in results else 0)
             
     except KeyboardInterrupt:
         print("\n❌ Pipeline interrupted by user")